@@ -6,11 +6,15 @@ Only needs to be run once per model. After download, the app runs fully offline.
 Usage:
     python scripts/download_model.py                  # downloads base.en (default)
     python scripts/download_model.py small.en          # downloads small.en
+    python scripts/download_model.py --preload tiny.en,small.en  # several, in parallel
+    python scripts/download_model.py --all             # every model, in parallel
     python scripts/download_model.py --list            # list available models
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 MODELS_DIR = Path(__file__).resolve().parent.parent / "models"
@@ -43,6 +47,23 @@ MODEL_SIZES: dict[str, str] = {
     "large-v3-turbo": "~1.5 GB",
 }
 
+# Files faster-whisper needs from a CTranslate2 model repo; everything else is skipped.
+MODEL_FILES: list[str] = [
+    "model.bin",
+    "config.json",
+    "tokenizer.json",
+    "vocabulary.*",
+    "preprocessor_config.json",
+]
+
+# Models fetched concurrently by --all / --preload
+MAX_PARALLEL_MODELS = 4
+
+
+def is_installed(model_name: str) -> bool:
+    """Return True if the model's weights are already in models/."""
+    return (MODELS_DIR / model_name / "model.bin").exists()
+
 
 def list_models() -> None:
     """Print available models with sizes and local status."""
@@ -50,21 +71,24 @@ def list_models() -> None:
     print(f"  {'Model':<20} {'Size':<12} {'Status'}")
     print(f"  {'─' * 20} {'─' * 12} {'─' * 12}")
     for name, size in MODEL_SIZES.items():
-        local_path = MODELS_DIR / name
-        status = "installed" if (local_path / "model.bin").exists() else ""
+        status = "installed" if is_installed(name) else ""
         print(f"  {name:<20} {size:<12} {status}")
     print()
 
 
-def download_model(model_name: str) -> None:
-    """Download a model from HuggingFace to the local models/ directory."""
+def _check_model_name(model_name: str) -> None:
     if model_name not in MODEL_REPOS:
         print(f"Error: Unknown model '{model_name}'.")
         print(f"Available: {', '.join(MODEL_REPOS.keys())}")
         sys.exit(1)
 
+
+def download_model(model_name: str) -> None:
+    """Download a model from HuggingFace to the local models/ directory."""
+    _check_model_name(model_name)
+
     dest = MODELS_DIR / model_name
-    if (dest / "model.bin").exists():
+    if is_installed(model_name):
         print(f"Model '{model_name}' is already downloaded at {dest}")
         return
 
@@ -73,6 +97,14 @@ def download_model(model_name: str) -> None:
     print(f"Downloading '{model_name}' ({size}) from {repo}...")
     print(f"Destination: {dest}\n")
 
+    # hf_transfer splits each file into ranges fetched over parallel connections.
+    # The flag is read when huggingface_hub is imported, so set it beforehand.
+    try:
+        import hf_transfer  # noqa: F401
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    except ImportError:
+        pass
+
     try:
         from huggingface_hub import snapshot_download
     except ImportError:
@@ -81,10 +113,30 @@ def download_model(model_name: str) -> None:
         sys.exit(1)
 
     MODELS_DIR.mkdir(parents=True, exist_ok=True)
-    snapshot_download(repo, local_dir=str(dest))
+    snapshot_download(
+        repo,
+        local_dir=str(dest),
+        allow_patterns=MODEL_FILES,
+        max_workers=min(8, os.cpu_count() or 4),
+    )
     print(f"\nDone! Model '{model_name}' downloaded to {dest}")
 
 
+def download_models(model_names: list[str]) -> None:
+    """Download several models concurrently, skipping ones already installed."""
+    for name in model_names:
+        _check_model_name(name)
+
+    pending = [name for name in dict.fromkeys(model_names) if not is_installed(name)]
+    if not pending:
+        print("All requested models are already downloaded.")
+        return
+
+    workers = min(MAX_PARALLEL_MODELS, len(pending))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(download_model, pending))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Download Whisper models for Sypher STT.",
@@ -100,13 +152,28 @@ def main() -> None:
         action="store_true",
         help="List available models and exit",
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Download every available model in parallel",
+    )
+    parser.add_argument(
+        "--preload",
+        metavar="MODELS",
+        help="Comma-separated models to download in parallel (e.g. tiny.en,small.en)",
+    )
     args = parser.parse_args()
 
     if args.list:
         list_models()
         return
 
-    download_model(args.model)
+    if args.all:
+        download_models(list(MODEL_REPOS))
+    elif args.preload:
+        download_models([name.strip() for name in args.preload.split(",") if name.strip()])
+    else:
+        download_model(args.model)
 
 
 if __name__ == "__main__":
@@ -8,21 +8,27 @@ Wires all components together:
 import logging
 import sys
 import threading
-import time
-
-import customtkinter as ctk
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 
 from sypher_stt import __version__
-from sypher_stt.audio import AudioRecorder
 from sypher_stt.clipboard import paste_text
-from sypher_stt.config import load_config
-from sypher_stt.hotkeys import HotkeyManager
+from sypher_stt.constants import AppState
 from sypher_stt.instance import SingleInstance
 from sypher_stt.logger import setup_logging
-from sypher_stt.settings import SettingsWindow
-from sypher_stt.sounds import play_error_sound, play_start_sound, play_stop_sound
-from sypher_stt.transcriber import Transcriber
-from sypher_stt.tray import AppState, TrayApp
+from sypher_stt.sounds import (
+    play_error_sound,
+    play_start_sound,
+    play_stop_sound,
+    prepare_sounds,
+)
+
+# Heavy modules (customtkinter, numpy/sounddevice, pynput, PIL/pystray) are
+# imported where they are first needed so a second launch can exit quickly.
+if TYPE_CHECKING:
+    import customtkinter as ctk
+
+    from sypher_stt.config import Config
 
 log = logging.getLogger(__name__)
 
@@ -31,24 +37,37 @@ class SypherSTT:
     """Main application class."""
 
     def __init__(self) -> None:
+        from sypher_stt.audio import AudioRecorder
+        from sypher_stt.config import load_config
+        from sypher_stt.hotkeys import HotkeyManager
+        from sypher_stt.settings import SettingsWindow
+        from sypher_stt.transcriber import Transcriber
+        from sypher_stt.tray import TrayApp
+
         self._config = load_config()
+        if self._config.sound_feedback:
+            # Write the tone files now so the first hotkey press doesn't pay for it
+            prepare_sounds()
 
         # Core
-        self._recorder = AudioRecorder(device=self._config.get("audio_device"))
-        self._transcriber = Transcriber(model_size=self._config.get("model", "base.en"))
+        self._recorder = AudioRecorder(device=self._config.audio_device)
+        self._transcriber = Transcriber(
+            model_size=self._config.model,
+            compute_type=self._config.compute_type,
+        )
 
         # Hotkey
         self._hotkey_manager = HotkeyManager(
             on_start=self._on_hotkey_press,
             on_stop=self._on_hotkey_release,
-            hotkey=self._config.get("hotkey", "f9"),
+            hotkey=self._config.hotkey,
         )
 
         # UI
         self._tray = TrayApp(
             on_quit=self._quit,
             on_settings=self._open_settings,
-            hotkey_name=self._config.get("hotkey", "f9"),
+            hotkey_name=self._config.hotkey,
             version=__version__,
         )
         self._settings_window = SettingsWindow(on_save=self._apply_settings)
@@ -56,7 +75,9 @@ class SypherSTT:
         # State
         self._processing = False
         self._state_lock = threading.Lock()
-        self._root: ctk.CTk = None
+        # One long-lived worker; _processing already rejects overlapping jobs
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt-worker")
+        self._root: Optional["ctk.CTk"] = None
 
     def _on_hotkey_press(self) -> None:
         with self._state_lock:
@@ -65,7 +86,7 @@ class SypherSTT:
 
         log.info("Recording started.")
         self._tray.set_state(AppState.RECORDING)
-        if self._config.get("sound_feedback", True):
+        if self._config.sound_feedback:
             play_start_sound()
 
         try:
@@ -74,7 +95,7 @@ class SypherSTT:
             log.error("Failed to start recording: %s", e)
             self._tray.set_state(AppState.IDLE)
             self._tray.notify("Recording Error", str(e))
-            if self._config.get("sound_feedback", True):
+            if self._config.sound_feedback:
                 play_error_sound()
 
     def _on_hotkey_release(self) -> None:
@@ -83,7 +104,7 @@ class SypherSTT:
                 return
             self._processing = True
 
-        if self._config.get("sound_feedback", True):
+        if self._config.sound_feedback:
             play_stop_sound()
 
         log.info("Recording stopped, transcribing...")
@@ -101,35 +122,59 @@ class SypherSTT:
             except Exception as e:
                 log.error("Transcription error: %s", e, exc_info=True)
                 self._tray.notify("Transcription Error", str(e))
-                if self._config.get("sound_feedback", True):
+                if self._config.sound_feedback:
                     play_error_sound()
             finally:
                 with self._state_lock:
                     self._processing = False
                 self._tray.set_state(AppState.IDLE)
 
-        threading.Thread(target=_transcribe, daemon=True).start()
+        self._worker.submit(_transcribe)
 
     def _open_settings(self) -> None:
         if self._root is not None:
             self._root.after(0, self._settings_window.show)
 
-    def _apply_settings(self, config: dict) -> None:
+    def _apply_settings(self, config: "Config") -> None:
+        from sypher_stt.audio import AudioRecorder
+
+        old_device = self._config.audio_device
         self._config = config
         log.info("Settings updated.")
 
-        self._hotkey_manager.hotkey_name = config.get("hotkey", "f9")
-        self._tray.update_hotkey_display(config.get("hotkey", "f9"))
-        self._transcriber.model_size = config.get("model", "base.en")
+        self._hotkey_manager.hotkey_name = config.hotkey
+        self._tray.update_hotkey_display(config.hotkey)
+        self._transcriber.model_size = config.model
+        self._transcriber.compute_type = config.compute_type
+
+        # The recorder holds its stream open, so only reopen on a device change
+        if config.audio_device != old_device:
+            self._recorder.close()
+            self._recorder = AudioRecorder(device=config.audio_device)
 
-        # Stop old recorder before replacing to avoid orphaned audio streams
-        if self._recorder.is_recording:
-            self._recorder.stop_recording()
-        self._recorder = AudioRecorder(device=config.get("audio_device"))
+        # A model or compute type change unloads the model; reload it now
+        # rather than on the next utterance
+        if config.warm_start and not self._transcriber.is_loaded:
+            self._warm_up_model()
+
+    def _warm_up_model(self) -> None:
+        """Load the Whisper model in the background so the first utterance doesn't wait."""
+        def _load() -> None:
+            try:
+                self._transcriber.ensure_model()
+                log.info("Model ready.")
+                self._tray.notify("Sypher STT", "Model loaded. Ready to transcribe.")
+            except Exception as e:
+                log.error("Failed to load model: %s", e)
+                self._tray.notify("Model Error", str(e))
+
+        threading.Thread(target=_load, daemon=True, name="whisper-warmup").start()
 
     def _quit(self) -> None:
         log.info("Shutting down.")
         self._hotkey_manager.stop()
+        self._recorder.close()
+        self._worker.shutdown(wait=False)
         self._tray.stop()
         if self._root is not None:
             self._root.after(0, self._root.destroy)
@@ -138,30 +183,25 @@ class SypherSTT:
         log.info("=" * 50)
         log.info("Sypher STT v%s starting.", __version__)
         log.info("Hotkey: %s | Model: %s",
-                 self._config.get("hotkey", "f9").upper(),
-                 self._config.get("model", "base.en"))
+                 self._config.hotkey.upper(),
+                 self._config.model)
         log.info("=" * 50)
 
-        # Pre-load model
-        def _preload() -> None:
-            try:
-                self._transcriber.ensure_model()
-                log.info("Model ready.")
-                self._tray.notify("Sypher STT", "Model loaded. Ready to transcribe.")
-            except Exception as e:
-                log.error("Failed to load model: %s", e)
-                self._tray.notify("Model Error", str(e))
-
-        threading.Thread(target=_preload, daemon=True).start()
-
         # Start hotkey listener
         self._hotkey_manager.start()
 
         # Start tray icon
         self._tray.run_detached()
-        time.sleep(0.5)
+        if not self._tray.wait_ready(2.0):
+            log.warning("Tray icon not ready after 2s, continuing.")
+
+        # Pre-load model once the tray can show the result
+        if self._config.warm_start:
+            self._warm_up_model()
 
         # Tkinter main loop (needed for settings window)
+        import customtkinter as ctk
+
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         self._root = ctk.CTk()
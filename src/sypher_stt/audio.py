@@ -2,12 +2,15 @@
 
 Uses sounddevice to capture audio from the default microphone
 as float32 numpy arrays at 16kHz mono — the format Whisper expects.
-Thread-safe with bounded recording duration.
+Thread-safe with bounded recording duration. The input stream is kept
+open between recordings so pressing the hotkey doesn't pay PortAudio's
+device start-up latency.
 """
 
 import logging
 import threading
-from typing import Optional
+import time
+from typing import NamedTuple, Optional
 
 import numpy as np
 import sounddevice as sd
@@ -15,13 +18,23 @@ import sounddevice as sd
 from sypher_stt.constants import (
     BLOCK_SIZE,
     CHANNELS,
+    MAX_RECORDING_SAMPLES,
     MAX_RECORDING_SECONDS,
     SAMPLE_RATE,
 )
 
+# Minimum seconds between "Audio stream status" warnings from the callback
+_STATUS_LOG_INTERVAL = 1.0
+
 log = logging.getLogger(__name__)
 
 
+class AudioDevice(NamedTuple):
+    """An audio input device as reported by PortAudio."""
+    index: int
+    name: str
+
+
 class AudioRecorder:
     """Thread-safe push-to-talk audio recorder.
 
@@ -30,6 +43,7 @@ class AudioRecorder:
         recorder.start_recording()
         # ... user speaks ...
         audio = recorder.stop_recording()
+        recorder.close()  # on shutdown or device change
     """
 
     def __init__(self, device: Optional[int] = None) -> None:
@@ -39,26 +53,75 @@ class AudioRecorder:
             device: Audio input device index. None = system default.
         """
         self._device = device
-        self._chunks: list[np.ndarray] = []
-        self._samples_recorded: int = 0
-        self._stream: Optional[sd.InputStream] = None
+        # Single-producer/single-consumer ring buffer. Only the audio callback
+        # advances _write_frame (after the samples are stored); the caller
+        # thread reads it once on stop, so the callback never takes a lock.
+        # Capacity is a power of two >= the max recording so offsets are a mask.
+        capacity = 1 << (MAX_RECORDING_SAMPLES - 1).bit_length()
+        self._buffer = np.empty(capacity, dtype=np.float32)
+        self._mask = capacity - 1
+        self._write_frame: int = 0
+        self._start_frame: int = 0
+        self._stream: Optional[sd.RawInputStream] = None
         self._recording = threading.Event()
         self._lock = threading.Lock()
+        self._last_status_log = 0.0
+
+        # Warm up the device now; start_recording retries if this fails
+        try:
+            self._open_stream()
+        except sd.PortAudioError as e:
+            log.warning("Could not open microphone yet: %s", e)
+
+    def _open_stream(self) -> None:
+        """Open and start the input stream. The callback discards audio until recording."""
+        stream = sd.RawInputStream(
+            samplerate=SAMPLE_RATE,
+            channels=CHANNELS,
+            dtype="float32",
+            blocksize=BLOCK_SIZE,
+            device=self._device,
+            callback=self._audio_callback,
+        )
+        try:
+            stream.start()
+        except sd.PortAudioError:
+            stream.close()
+            raise
+        self._stream = stream
 
     def _audio_callback(
         self,
-        indata: np.ndarray,
+        indata: object,
         frames: int,
         time_info: object,
         status: sd.CallbackFlags,
     ) -> None:
-        """Called by sounddevice for each audio block during recording."""
+        """Called by sounddevice for each audio block while the stream is open.
+
+        Blocks are discarded unless a recording is in progress.
+
+        indata is the raw cffi buffer; it is viewed as float32 and copied
+        straight into the ring without building an intermediate array.
+        """
         if status:
-            log.warning("Audio stream status: %s", status)
+            # Over/underruns repeat every block; don't hit the log file each time
+            now = time.monotonic()
+            if now - self._last_status_log >= _STATUS_LOG_INTERVAL:
+                self._last_status_log = now
+                log.warning("Audio stream status: %s", status)
         if self._recording.is_set():
-            self._chunks.append(indata[:, 0].copy())
-            self._samples_recorded += frames
-            if self._samples_recorded >= SAMPLE_RATE * MAX_RECORDING_SECONDS:
+            write_frame = self._write_frame
+            remaining = MAX_RECORDING_SAMPLES - (write_frame - self._start_frame)
+            count = min(frames, remaining)
+            offset = write_frame & self._mask
+            first = min(count, len(self._buffer) - offset)
+            samples = np.frombuffer(indata, dtype=np.float32, count=frames)
+            self._buffer[offset:offset + first] = samples[:first]
+            if first < count:
+                self._buffer[:count - first] = samples[first:count]
+            self._write_frame = write_frame + count
+            if count == remaining:
                 log.warning(
                     "Max recording duration (%ds) reached, auto-stopping.",
                     MAX_RECORDING_SECONDS,
@@ -68,23 +131,25 @@ class AudioRecorder:
     def start_recording(self) -> None:
         """Begin capturing audio from the microphone."""
         with self._lock:
-            self._chunks = []
-            self._samples_recorded = 0
+            # Drop the previous utterance first so a failed reopen below can't
+            # leave it to be returned (and pasted) again by stop_recording
+            self._start_frame = self._write_frame
+            # PortAudio stops the stream if the device is unplugged or the
+            # callback aborts; reopen it rather than record silence
+            if self._stream is not None and not self._stream.active:
+                log.warning("Audio stream is no longer active, reopening.")
+                try:
+                    self._stream.close()
+                except Exception as e:
+                    log.debug("Error closing stale audio stream: %s", e)
+                self._stream = None
+            if self._stream is None:
+                try:
+                    self._open_stream()
+                except sd.PortAudioError as e:
+                    log.error("Failed to open microphone: %s", e)
+                    raise
             self._recording.set()
-            try:
-                self._stream = sd.InputStream(
-                    samplerate=SAMPLE_RATE,
-                    channels=CHANNELS,
-                    dtype="float32",
-                    blocksize=BLOCK_SIZE,
-                    device=self._device,
-                    callback=self._audio_callback,
-                )
-                self._stream.start()
-            except sd.PortAudioError as e:
-                self._recording.clear()
-                log.error("Failed to open microphone: %s", e)
-                raise
 
     def stop_recording(self) -> np.ndarray:
         """Stop capturing and return the recorded audio.
@@ -93,6 +158,20 @@ class AudioRecorder:
             Numpy float32 array of audio samples at 16kHz mono.
             Empty array if nothing was recorded.
         """
+        with self._lock:
+            self._recording.clear()
+            length = self._write_frame - self._start_frame
+            if length:
+                audio = self._read_frames(self._start_frame, length)
+                # Consume it so a second stop doesn't return the same audio
+                self._start_frame = self._write_frame
+                duration = len(audio) / SAMPLE_RATE
+                log.debug("Recorded %.1fs of audio (%d samples)", duration, len(audio))
+                return audio
+            return np.array([], dtype=np.float32)
+
+    def close(self) -> None:
+        """Stop recording and release the input stream."""
         with self._lock:
             self._recording.clear()
             if self._stream is not None:
@@ -102,13 +181,14 @@ class AudioRecorder:
                 except Exception as e:
                     log.warning("Error closing audio stream: %s", e)
                 self._stream = None
-            if self._chunks:
-                audio = np.concatenate(self._chunks)
-                self._chunks = []
-                duration = len(audio) / SAMPLE_RATE
-                log.debug("Recorded %.1fs of audio (%d samples)", duration, len(audio))
-                return audio
-            return np.array([], dtype=np.float32)
+
+    def _read_frames(self, frame: int, count: int) -> np.ndarray:
+        """Copy count samples starting at an absolute frame out of the ring."""
+        offset = frame & self._mask
+        end = offset + count
+        if end <= len(self._buffer):
+            return self._buffer[offset:end].copy()
+        return np.concatenate((self._buffer[offset:], self._buffer[:end - len(self._buffer)]))
 
     @property
     def is_recording(self) -> bool:
@@ -116,11 +196,10 @@ class AudioRecorder:
         return self._recording.is_set()
 
     @staticmethod
-    def list_devices() -> list[dict]:
+    def list_devices() -> list[AudioDevice]:
         """Return available audio input devices."""
-        devices = sd.query_devices()
-        result = []
-        for i, dev in enumerate(devices):
-            if dev["max_input_channels"] > 0:
-                result.append({"index": i, "name": dev["name"]})
-        return result
+        return [
+            AudioDevice(i, dev["name"])
+            for i, dev in enumerate(sd.query_devices())
+            if dev["max_input_channels"] > 0
+        ]
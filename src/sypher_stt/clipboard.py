@@ -1,29 +1,107 @@
 """Clipboard and paste module for outputting transcribed text.
 
 Copies text to the system clipboard and simulates Ctrl+V to paste
-into whatever window is currently focused.
+into whatever window is currently focused. On Windows the keystrokes
+are injected with a single SendInput call; pyautogui is used elsewhere.
 
 Note: Non-text clipboard content (images, files) cannot be preserved
 by pyperclip. If the user had non-text content, it will be lost.
 """
 
+import ctypes
+import ctypes.wintypes
 import logging
 import sys
 import time
 import threading
 
 import pyperclip
-import pyautogui
 
 log = logging.getLogger(__name__)
 
-pyautogui.PAUSE = 0.02
-
 # Clipboard format constants (Win32)
 _CF_TEXT = 1
 _CF_UNICODETEXT = 13
 _TEXT_FORMATS = {_CF_TEXT, _CF_UNICODETEXT}
 
+# SendInput constants (Win32)
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_VK_CONTROL = 0x11
+_VK_V = 0x56
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.wintypes.LONG),
+        ("dy", ctypes.wintypes.LONG),
+        ("mouseData", ctypes.wintypes.DWORD),
+        ("dwFlags", ctypes.wintypes.DWORD),
+        ("time", ctypes.wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.wintypes.WORD),
+        ("wScan", ctypes.wintypes.WORD),
+        ("dwFlags", ctypes.wintypes.DWORD),
+        ("time", ctypes.wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),  # ULONG_PTR
+    ]
+
+
+class _HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", ctypes.wintypes.DWORD),
+        ("wParamL", ctypes.wintypes.WORD),
+        ("wParamH", ctypes.wintypes.WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT), ("hi", _HARDWAREINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.wintypes.DWORD), ("union", _INPUTUNION)]
+
+
+def _key_input(vk: int, flags: int = 0) -> _INPUT:
+    return _INPUT(type=_INPUT_KEYBOARD, union=_INPUTUNION(ki=_KEYBDINPUT(wVk=vk, dwFlags=flags)))
+
+
+# Ctrl down, V down, V up, Ctrl up — built once, reused for every paste
+_CTRL_V_INPUTS = (_INPUT * 4)(
+    _key_input(_VK_CONTROL),
+    _key_input(_VK_V),
+    _key_input(_VK_V, _KEYEVENTF_KEYUP),
+    _key_input(_VK_CONTROL, _KEYEVENTF_KEYUP),
+)
+
+
+def _setup_user32() -> "ctypes.WinDLL":
+    """Configure user32 clipboard function signatures for 64-bit safety."""
+    user32 = ctypes.windll.user32
+    user32.OpenClipboard.restype = ctypes.wintypes.BOOL
+    user32.OpenClipboard.argtypes = [ctypes.wintypes.HWND]
+    user32.CloseClipboard.restype = ctypes.wintypes.BOOL
+    user32.CloseClipboard.argtypes = []
+    user32.EnumClipboardFormats.restype = ctypes.wintypes.UINT
+    user32.EnumClipboardFormats.argtypes = [ctypes.wintypes.UINT]
+    user32.SendInput.restype = ctypes.wintypes.UINT
+    user32.SendInput.argtypes = [
+        ctypes.wintypes.UINT,     # cInputs
+        ctypes.POINTER(_INPUT),   # pInputs
+        ctypes.c_int,             # cbSize
+    ]
+    return user32
+
+
+# Resolved once at import instead of on every paste
+_user32 = _setup_user32() if sys.platform == "win32" else None
+
 
 def _clipboard_has_text_only() -> bool:
     """Check if the clipboard contains only text (no images/files).
@@ -31,18 +109,16 @@ def _clipboard_has_text_only() -> bool:
     Returns True if clipboard is empty or text-only.
     Returns True on non-Windows (can't detect, assume text).
     """
-    if sys.platform != "win32":
+    if _user32 is None:
         return True
     try:
-        import ctypes
-        user32 = ctypes.windll.user32
-        if not user32.OpenClipboard(None):
+        if not _user32.OpenClipboard(None):
             return True
         try:
             fmt = 0
             has_non_text = False
             while True:
-                fmt = user32.EnumClipboardFormats(fmt)
+                fmt = _user32.EnumClipboardFormats(fmt)
                 if fmt == 0:
                     break
                 if fmt not in _TEXT_FORMATS:
@@ -50,11 +126,27 @@ def _clipboard_has_text_only() -> bool:
                     break
             return not has_non_text
         finally:
-            user32.CloseClipboard()
+            _user32.CloseClipboard()
     except Exception:
         return True  # Assume text on error
 
 
+def _send_ctrl_v() -> None:
+    """Simulate Ctrl+V in the focused window.
+
+    On Windows all four key events go out in one SendInput call with no
+    inter-key delay. Other platforms fall back to pyautogui.
+    """
+    if _user32 is None:
+        import pyautogui
+        pyautogui.PAUSE = 0.02
+        pyautogui.hotkey("ctrl", "v")
+        return
+    sent = _user32.SendInput(len(_CTRL_V_INPUTS), _CTRL_V_INPUTS, ctypes.sizeof(_INPUT))
+    if sent != len(_CTRL_V_INPUTS):
+        raise ctypes.WinError()
+
+
 def paste_text(text: str, restore_clipboard: bool = True) -> None:
     """Copy text to clipboard and paste into the active window.
 
@@ -69,6 +161,7 @@ def paste_text(text: str, restore_clipboard: bool = True) -> None:
     old_clipboard = None
     can_restore = False
 
+    # Only probe the clipboard formats when the old contents will be restored
     if restore_clipboard:
         if _clipboard_has_text_only():
             try:
@@ -79,11 +172,11 @@ def paste_text(text: str, restore_clipboard: bool = True) -> None:
         else:
             log.debug("Clipboard contains non-text content; cannot preserve.")
 
+    # SetClipboardData is synchronous, so the text is committed on return
     pyperclip.copy(text)
-    time.sleep(0.05)
 
     try:
-        pyautogui.hotkey("ctrl", "v")
+        _send_ctrl_v()
     except Exception as e:
         log.error("Failed to simulate Ctrl+V: %s", e)
         return
@@ -92,6 +185,8 @@ def paste_text(text: str, restore_clipboard: bool = True) -> None:
 
     if can_restore:
         def _restore() -> None:
+            # SendInput only queues the keystrokes; give the target window
+            # time to read the clipboard before swapping the old text back.
             time.sleep(0.1)
             try:
                 pyperclip.copy(old_clipboard if old_clipboard else "")
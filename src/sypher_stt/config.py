@@ -6,11 +6,15 @@ All values are validated against whitelists on load.
 
 import json
 import logging
+import os
+from dataclasses import asdict, dataclass
 from typing import Optional
 
 from sypher_stt.constants import (
     AVAILABLE_MODELS,
+    COMPUTE_TYPES,
     CONFIG_PATH,
+    DEFAULT_COMPUTE_TYPE,
     DEFAULT_HOTKEY,
     DEFAULT_MODEL,
 )
@@ -18,48 +22,94 @@ from sypher_stt.hotkeys import KEY_MAP
 
 log = logging.getLogger(__name__)
 
-DEFAULT_CONFIG = {
-    "hotkey": DEFAULT_HOTKEY,
-    "model": DEFAULT_MODEL,
-    "audio_device": None,
-    "sound_feedback": True,
-}
 
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Validated application settings.
 
-def load_config() -> dict:
+    Immutable so it can be shared across threads; build a new instance
+    to change settings.
+    """
+
+    hotkey: str = DEFAULT_HOTKEY
+    model: str = DEFAULT_MODEL
+    audio_device: Optional[int] = None
+    sound_feedback: bool = True
+    compute_type: str = DEFAULT_COMPUTE_TYPE
+    warm_start: bool = True  # load the model at startup instead of on first use
+
+
+DEFAULT_CONFIG = Config()
+
+# (st_mtime_ns, st_size, parsed config) of the last config file read
+_CONFIG_CACHE: Optional[tuple[int, int, Config]] = None
+
+
+def load_config() -> Config:
     """Load configuration from disk, or return defaults.
 
     Validates all values against whitelists to prevent injection
-    of arbitrary model names or unknown config keys.
+    of arbitrary model names or unknown config keys. The parsed result
+    is reused until the file's modification time or size changes.
+    """
+    global _CONFIG_CACHE
+    try:
+        st = CONFIG_PATH.stat()
+    except FileNotFoundError:
+        return DEFAULT_CONFIG
+    except OSError as e:
+        log.warning("Failed to load config (%s), using defaults.", e)
+        return DEFAULT_CONFIG
+
+    cached = _CONFIG_CACHE
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    config = _read_config()
+    _CONFIG_CACHE = (st.st_mtime_ns, st.st_size, config)
+    return config
+
+
+def _read_config() -> Config:
+    """Parse and validate the config file."""
+    try:
+        saved = json.loads(CONFIG_PATH.read_bytes())
+        if not isinstance(saved, dict):
+            log.warning("Config file is not a dict, using defaults.")
+            return DEFAULT_CONFIG
+        values = {}
+        if saved.get("hotkey") in KEY_MAP:
+            values["hotkey"] = saved["hotkey"]
+        if saved.get("model") in AVAILABLE_MODELS:
+            values["model"] = saved["model"]
+        if saved.get("audio_device") is None or isinstance(saved.get("audio_device"), int):
+            values["audio_device"] = saved.get("audio_device")
+        if isinstance(saved.get("sound_feedback"), bool):
+            values["sound_feedback"] = saved["sound_feedback"]
+        if saved.get("compute_type") in COMPUTE_TYPES:
+            values["compute_type"] = saved["compute_type"]
+        if isinstance(saved.get("warm_start"), bool):
+            values["warm_start"] = saved["warm_start"]
+        log.debug("Loaded config from %s", CONFIG_PATH)
+        return Config(**values)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+        log.warning("Failed to load config (%s), using defaults.", e)
+        return DEFAULT_CONFIG
+
+
+def save_config(config: Config) -> None:
+    """Save configuration to disk.
+
+    Written compactly; set SYPHER_DEBUG_JSON=1 to pretty-print it.
     """
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                saved = json.load(f)
-            if not isinstance(saved, dict):
-                log.warning("Config file is not a dict, using defaults.")
-                return dict(DEFAULT_CONFIG)
-            config = dict(DEFAULT_CONFIG)
-            if saved.get("hotkey") in KEY_MAP:
-                config["hotkey"] = saved["hotkey"]
-            if saved.get("model") in AVAILABLE_MODELS:
-                config["model"] = saved["model"]
-            if saved.get("audio_device") is None or isinstance(saved.get("audio_device"), int):
-                config["audio_device"] = saved["audio_device"]
-            if isinstance(saved.get("sound_feedback"), bool):
-                config["sound_feedback"] = saved["sound_feedback"]
-            log.debug("Loaded config from %s", CONFIG_PATH)
-            return config
-        except (json.JSONDecodeError, IOError) as e:
-            log.warning("Failed to load config (%s), using defaults.", e)
-    return dict(DEFAULT_CONFIG)
-
-
-def save_config(config: dict) -> None:
-    """Save configuration to disk."""
+    global _CONFIG_CACHE
+    if os.environ.get("SYPHER_DEBUG_JSON") == "1":
+        data = json.dumps(asdict(config), indent=2)
+    else:
+        data = json.dumps(asdict(config), separators=(",", ":"))
     try:
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        CONFIG_PATH.write_text(data, encoding="utf-8")
         log.debug("Saved config to %s", CONFIG_PATH)
-    except IOError as e:
+        # Re-validate on next load rather than trusting the caller's values
+        _CONFIG_CACHE = None
+    except OSError as e:
         log.error("Failed to save config: %s", e)
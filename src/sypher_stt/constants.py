@@ -1,6 +1,7 @@
 """Application-wide constants and path resolution."""
 
 import os
+from enum import Enum
 from pathlib import Path
 
 
@@ -30,6 +31,7 @@ SAMPLE_RATE = 16000
 CHANNELS = 1
 BLOCK_SIZE = 1024
 MAX_RECORDING_SECONDS = 120
+MAX_RECORDING_SAMPLES = SAMPLE_RATE * MAX_RECORDING_SECONDS
 
 # Whisper
 AVAILABLE_MODELS = [
@@ -41,9 +43,22 @@ AVAILABLE_MODELS = [
 ]
 DEFAULT_MODEL = "base.en"
 
+# CTranslate2 compute types offered for CPU inference: int8 is fastest,
+# float32 trades speed for accuracy
+COMPUTE_TYPES = ["int8", "float32"]
+DEFAULT_COMPUTE_TYPE = "int8"
+
 # Hotkey
 DEFAULT_HOTKEY = "f9"
 
+# Tray/app states — defined here so app.py can use them without loading the tray
+class AppState(Enum):
+    """Visual states for the tray icon."""
+    IDLE = "idle"
+    RECORDING = "recording"
+    TRANSCRIBING = "transcribing"
+
+
 # Mutex name for single-instance enforcement (Windows named mutex)
 # Local\ scope = per-session; prevents cross-session DoS via mutex squatting
 MUTEX_NAME = "Local\\SypherSTTSingleInstance"
@@ -31,6 +31,10 @@ KEY_MAP: dict[str, keyboard.Key] = {
     "insert": keyboard.Key.insert,
 }
 
+# Display names for the settings menu, built once and passed as-is to the
+# option menu. Kept in KEY_MAP order: sorting would put F10-F12 before F2.
+HOTKEY_OPTIONS: tuple[str, ...] = tuple(k.upper() for k in KEY_MAP)
+
 
 class HotkeyManager:
     """Global push-to-talk hotkey listener.
@@ -57,10 +61,11 @@ class HotkeyManager:
         self._active = False
 
     def _on_press(self, key: keyboard.Key) -> None:
-        if not self._active:
+        # Key members are singletons: skip the lock for every unrelated keystroke
+        if not self._active or key is not self._hotkey:
             return
         with self._held_lock:
-            if key == self._hotkey and not self._is_held:
+            if not self._is_held:
                 self._is_held = True
             else:
                 return
@@ -70,10 +75,10 @@ class HotkeyManager:
             log.error("on_start callback error: %s", e, exc_info=True)
 
     def _on_release(self, key: keyboard.Key) -> None:
-        if not self._active:
+        if not self._active or key is not self._hotkey:
             return
         with self._held_lock:
-            if key == self._hotkey and self._is_held:
+            if self._is_held:
                 self._is_held = False
             else:
                 return
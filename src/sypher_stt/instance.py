@@ -15,7 +15,7 @@ log = logging.getLogger(__name__)
 ERROR_ALREADY_EXISTS = 183
 
 
-def _setup_kernel32() -> ctypes.WinDLL:
+def _setup_kernel32() -> "ctypes.WinDLL":
     """Configure kernel32 function signatures for 64-bit safety."""
     kernel32 = ctypes.windll.kernel32
     kernel32.CreateMutexW.restype = ctypes.wintypes.HANDLE
@@ -33,6 +33,10 @@ def _setup_kernel32() -> ctypes.WinDLL:
     return kernel32
 
 
+# Configured once at import rather than on every acquire/release
+_KERNEL32 = _setup_kernel32() if sys.platform == "win32" else None
+
+
 class SingleInstance:
     """Acquires a Windows named mutex. Raises if another instance exists."""
 
@@ -45,16 +49,15 @@ class SingleInstance:
         Returns:
             True if this is the only instance, False if another is running.
         """
-        if sys.platform != "win32":
+        if _KERNEL32 is None:
             return True  # No enforcement on non-Windows
 
-        kernel32 = _setup_kernel32()
-        self._handle = kernel32.CreateMutexW(None, True, MUTEX_NAME)
-        last_error = kernel32.GetLastError()
+        self._handle = _KERNEL32.CreateMutexW(None, True, MUTEX_NAME)
+        last_error = _KERNEL32.GetLastError()
 
         if last_error == ERROR_ALREADY_EXISTS:
             log.warning("Another instance of Sypher STT is already running.")
-            kernel32.CloseHandle(self._handle)
+            _KERNEL32.CloseHandle(self._handle)
             self._handle = None
             return False
 
@@ -64,8 +67,7 @@ class SingleInstance:
     def release(self) -> None:
         """Release the mutex on shutdown."""
         if self._handle is not None:
-            kernel32 = _setup_kernel32()
-            kernel32.ReleaseMutex(self._handle)
-            kernel32.CloseHandle(self._handle)
+            _KERNEL32.ReleaseMutex(self._handle)
+            _KERNEL32.CloseHandle(self._handle)
             self._handle = None
             log.debug("Single-instance mutex released.")
@@ -5,103 +5,133 @@ Provides a CustomTkinter GUI for configuring the app:
 - Whisper model selection
 - Audio input device selection
 - Sound feedback toggle
+- Accuracy vs. speed (model compute type)
 """
 
+import dataclasses
 import logging
+import threading
+import time
 from typing import Callable, Optional
 
 import customtkinter as ctk
-import sounddevice as sd
 
-from sypher_stt.config import DEFAULT_CONFIG, load_config, save_config
+from sypher_stt.audio import AudioDevice, AudioRecorder
+from sypher_stt.config import Config, load_config, save_config
 from sypher_stt.constants import DEFAULT_MODEL
-from sypher_stt.hotkeys import KEY_MAP
+from sypher_stt.hotkeys import HOTKEY_OPTIONS
 from sypher_stt.transcriber import get_local_models
 
 log = logging.getLogger(__name__)
 
+# Enumerating devices can take hundreds of ms on WASAPI; reuse results briefly
+_DEVICE_TTL = 5.0
+_DEVICE_CACHE: Optional[tuple[float, list[AudioDevice]]] = None
+_DEVICES_LOADING = "Loading…"
+
+# Created on first use; a CTkFont needs a Tk root to exist
+_TITLE_FONT: Optional[ctk.CTkFont] = None
+
+
+def _title_font() -> ctk.CTkFont:
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        _TITLE_FONT = ctk.CTkFont(size=18, weight="bold")
+    return _TITLE_FONT
+
 
 class SettingsWindow:
     """Settings dialog for Sypher STT."""
 
-    def __init__(self, on_save: Callable[[dict], None]) -> None:
+    def __init__(self, on_save: Callable[[Config], None]) -> None:
         self._on_save = on_save
         self._window: Optional[ctk.CTkToplevel] = None
         self._config = load_config()
-        self._device_indices: list[Optional[int]] = []
+        self._device_names: list[str] = []
+        self._name_to_index: dict[str, Optional[int]] = {}
 
     def show(self) -> None:
-        """Open the settings window. Creates a new one if not already open."""
+        """Open the settings window.
+
+        Widgets are built on the first call; later calls re-show the hidden
+        window with values refreshed from the saved config and the device
+        list refreshed (through a short-lived cache) in the background.
+        """
         if self._window is not None and self._window.winfo_exists():
+            if self._window.state() == "withdrawn":
+                self._load_values()
+                self._refresh_devices()
+                self._window.deiconify()
             self._window.focus_force()
             return
 
-        self._config = load_config()
+        self._build()
+        self._load_values()
+
+    def _build(self) -> None:
         self._window = ctk.CTkToplevel()
         self._window.title("Sypher STT — Settings")
-        self._window.geometry("420x440")
+        self._window.geometry("420x490")
         self._window.resizable(False, False)
         self._window.attributes("-topmost", True)
+        self._window.protocol("WM_DELETE_WINDOW", self._close)
 
         # Title
         ctk.CTkLabel(
             self._window,
             text="Sypher STT Settings",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_title_font(),
         ).pack(pady=(20, 15))
 
         # Hotkey
         hotkey_frame = ctk.CTkFrame(self._window)
         hotkey_frame.pack(fill="x", padx=20, pady=5)
         ctk.CTkLabel(hotkey_frame, text="Push-to-talk hotkey:").pack(side="left", padx=10, pady=10)
-        hotkey_options = [k.upper() for k in KEY_MAP.keys()]
-        self._hotkey_var = ctk.StringVar(value=self._config["hotkey"].upper())
+        self._hotkey_var = ctk.StringVar()
         ctk.CTkOptionMenu(
-            hotkey_frame, variable=self._hotkey_var, values=hotkey_options, width=120,
+            hotkey_frame, variable=self._hotkey_var, values=HOTKEY_OPTIONS, width=120,
         ).pack(side="right", padx=10, pady=10)
 
         # Model
         model_frame = ctk.CTkFrame(self._window)
         model_frame.pack(fill="x", padx=20, pady=5)
         ctk.CTkLabel(model_frame, text="Whisper model:").pack(side="left", padx=10, pady=10)
-        local_models = get_local_models()
-        model_options = local_models if local_models else [DEFAULT_MODEL]
-        current_model = self._config["model"] if self._config["model"] in model_options else model_options[0]
-        self._model_var = ctk.StringVar(value=current_model)
-        ctk.CTkOptionMenu(
-            model_frame, variable=self._model_var, values=model_options, width=160,
-        ).pack(side="right", padx=10, pady=10)
+        self._model_var = ctk.StringVar()
+        self._model_menu = ctk.CTkOptionMenu(
+            model_frame, variable=self._model_var, values=[DEFAULT_MODEL], width=160,
+        )
+        self._model_menu.pack(side="right", padx=10, pady=10)
 
-        # Audio device
+        # Audio device — enumerated off the Tk thread so the window paints first
         device_frame = ctk.CTkFrame(self._window)
         device_frame.pack(fill="x", padx=20, pady=5)
         ctk.CTkLabel(device_frame, text="Microphone:").pack(side="left", padx=10, pady=10)
-
-        input_devices = self._get_input_devices()
-        device_names = ["System Default"] + [name for _, name in input_devices]
-        self._device_indices = [None] + [idx for idx, _ in input_devices]
-
-        current_device = self._config.get("audio_device")
-        if current_device is None:
-            current_name = "System Default"
-        else:
-            matches = [name for idx, name in input_devices if idx == current_device]
-            current_name = matches[0] if matches else "System Default"
-
-        self._device_var = ctk.StringVar(value=current_name)
-        ctk.CTkOptionMenu(
-            device_frame, variable=self._device_var, values=device_names, width=200,
-        ).pack(side="right", padx=10, pady=10)
+        self._device_var = ctk.StringVar(value=_DEVICES_LOADING)
+        self._device_menu = ctk.CTkOptionMenu(
+            device_frame, variable=self._device_var, values=[_DEVICES_LOADING],
+            width=200, state="disabled",
+        )
+        self._device_menu.pack(side="right", padx=10, pady=10)
+        self._refresh_devices()
 
         # Sound feedback toggle
         sound_frame = ctk.CTkFrame(self._window)
         sound_frame.pack(fill="x", padx=20, pady=5)
         ctk.CTkLabel(sound_frame, text="Sound feedback:").pack(side="left", padx=10, pady=10)
-        self._sound_var = ctk.BooleanVar(value=self._config.get("sound_feedback", True))
+        self._sound_var = ctk.BooleanVar()
         ctk.CTkSwitch(
             sound_frame, variable=self._sound_var, text="", width=40,
         ).pack(side="right", padx=10, pady=10)
 
+        # Accuracy vs. speed: full float32 precision instead of int8 quantization
+        accuracy_frame = ctk.CTkFrame(self._window)
+        accuracy_frame.pack(fill="x", padx=20, pady=5)
+        ctk.CTkLabel(accuracy_frame, text="Prefer accuracy over speed:").pack(side="left", padx=10, pady=10)
+        self._accuracy_var = ctk.BooleanVar()
+        ctk.CTkSwitch(
+            accuracy_frame, variable=self._accuracy_var, text="", width=40,
+        ).pack(side="right", padx=10, pady=10)
+
         # Buttons
         btn_frame = ctk.CTkFrame(self._window, fg_color="transparent")
         btn_frame.pack(fill="x", padx=20, pady=20)
@@ -113,35 +143,97 @@ class SettingsWindow:
             fg_color="gray40", hover_color="gray30",
         ).pack(side="right", padx=5)
 
+    def _load_values(self) -> None:
+        """Point the widgets at the saved config, discarding unsaved edits."""
+        self._config = load_config()
+        self._hotkey_var.set(self._config.hotkey.upper())
+
+        local_models = get_local_models()
+        model_options = local_models if local_models else [DEFAULT_MODEL]
+        self._model_menu.configure(values=model_options)
+        current_model = self._config.model if self._config.model in model_options else model_options[0]
+        self._model_var.set(current_model)
+
+        self._select_current_device()
+
+        self._sound_var.set(self._config.sound_feedback)
+        self._accuracy_var.set(self._config.compute_type == "float32")
+
     def _save(self) -> None:
-        device_name = self._device_var.get()
-        device_names_list = ["System Default"] + [
-            name for _, name in self._get_input_devices()
-        ]
-        idx_in_list = device_names_list.index(device_name) if device_name in device_names_list else 0
-        device_index = self._device_indices[idx_in_list] if idx_in_list < len(self._device_indices) else None
-
-        self._config = {
-            "hotkey": self._hotkey_var.get().lower(),
-            "model": self._model_var.get(),
-            "audio_device": device_index,
-            "sound_feedback": self._sound_var.get(),
-        }
+        # Resolve against the devices shown in the menu rather than re-enumerating;
+        # keep the saved device if the list hasn't finished loading
+        device_index = self._name_to_index.get(self._device_var.get(), self._config.audio_device)
+
+        # replace() keeps settings that have no widget, such as warm_start
+        self._config = dataclasses.replace(
+            self._config,
+            hotkey=self._hotkey_var.get().lower(),
+            model=self._model_var.get(),
+            audio_device=device_index,
+            sound_feedback=self._sound_var.get(),
+            compute_type="float32" if self._accuracy_var.get() else "int8",
+        )
         save_config(self._config)
         self._on_save(self._config)
         self._close()
         log.info("Settings saved.")
 
+    def _refresh_devices(self) -> None:
+        """Re-enumerate input devices without blocking the Tk thread."""
+        threading.Thread(
+            target=self._populate_devices_async, name="device-enum", daemon=True,
+        ).start()
+
+    def _populate_devices_async(self) -> None:
+        """Enumerate input devices on a worker thread and hand them to Tk."""
+        try:
+            devices = self._get_input_devices()
+        except Exception as e:
+            log.warning("Could not list audio devices: %s", e)
+            devices = []
+        # Only the Tk thread may touch widgets
+        self._window.after(0, lambda res=devices: self._apply_device_list(res))
+
+    def _apply_device_list(self, devices: list[AudioDevice]) -> None:
+        """Fill the microphone menu once enumeration finishes."""
+        if self._window is None or not self._window.winfo_exists():
+            return
+        # On a refresh, keep a pick the user made meanwhile if it still exists
+        selected = self._device_var.get() if self._name_to_index else None
+        self._device_names = ["System Default"] + [d.name for d in devices]
+        # The menu can't tell duplicate names apart (the same mic under several
+        # host APIs); keep the first, as PortAudio lists it
+        self._name_to_index = {"System Default": None}
+        for d in devices:
+            self._name_to_index.setdefault(d.name, d.index)
+        self._device_menu.configure(values=self._device_names, state="normal")
+        if selected in self._name_to_index:
+            self._device_var.set(selected)
+        else:
+            self._select_current_device()
+
+    def _select_current_device(self) -> None:
+        """Show the saved device in the menu; no-op while the list is loading."""
+        if not self._name_to_index:
+            return
+        current_name = "System Default"
+        for name, index in self._name_to_index.items():
+            if index is not None and index == self._config.audio_device:
+                current_name = name
+                break
+        self._device_var.set(current_name)
+
     def _close(self) -> None:
+        # Hide rather than destroy so the next show() is instant
         if self._window is not None:
-            self._window.destroy()
-            self._window = None
+            self._window.withdraw()
 
     @staticmethod
-    def _get_input_devices() -> list[tuple[int, str]]:
-        devices = sd.query_devices()
-        return [
-            (i, d["name"])
-            for i, d in enumerate(devices)
-            if d["max_input_channels"] > 0
-        ]
+    def _get_input_devices() -> list[AudioDevice]:
+        global _DEVICE_CACHE
+        now = time.monotonic()
+        if _DEVICE_CACHE is not None and now - _DEVICE_CACHE[0] < _DEVICE_TTL:
+            return _DEVICE_CACHE[1]
+        devices = AudioRecorder.list_devices()
+        _DEVICE_CACHE = (now, devices)
+        return devices
@@ -1,41 +1,128 @@
 """Sound feedback for recording start/stop.
 
-Uses Windows Beep API for lightweight audio cues — no WAV files needed.
+Short sine tones are generated on first use as tiny WAV files in the app data
+directory and played asynchronously with the Windows PlaySound API, so
+callers never block and no helper thread is needed.
 """
 
 import logging
-import threading
+import math
+import os
+import struct
 import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Optional
+
+from sypher_stt.constants import APPDATA_DIR
+
+if sys.platform == "win32":
+    import winsound
+else:
+    winsound = None
 
 log = logging.getLogger(__name__)
 
+SOUNDS_DIR = APPDATA_DIR / "sounds"
+
+_TONE_SAMPLE_RATE = 22050
+_TONE_AMPLITUDE = 0.4 * 32767
+_TONE_FADE_MS = 5  # ramp in/out to avoid clicks
+
+# name -> (frequency Hz, duration ms)
+_TONES: dict[str, tuple[int, int]] = {
+    "start": (800, 100),  # short ascending tone — recording started
+    "stop": (400, 100),   # short descending tone — recording stopped
+    "error": (200, 200),  # low tone — error occurred
+}
+
+
+def _make_wav(frequency: int, duration_ms: int) -> bytes:
+    """Return a mono 16-bit PCM WAV file containing a sine tone."""
+    n = _TONE_SAMPLE_RATE * duration_ms // 1000
+    fade = _TONE_SAMPLE_RATE * _TONE_FADE_MS // 1000
+    step = 2 * math.pi * frequency / _TONE_SAMPLE_RATE
+    samples = array("h", (
+        int(_TONE_AMPLITUDE * min(1.0, i / fade, (n - i) / fade) * math.sin(step * i))
+        for i in range(n)
+    ))
+    if sys.byteorder != "little":
+        samples.byteswap()
+    data = samples.tobytes()
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(data), b"WAVE",
+        b"fmt ", 16, 1, 1, _TONE_SAMPLE_RATE, _TONE_SAMPLE_RATE * 2, 2, 16,
+        b"data", len(data),
+    )
+    return header + data
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file so another instance never plays a half-written WAV."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Python's winsound can't play an in-memory WAV asynchronously
+# (SND_MEMORY | SND_ASYNC raises), so the tones are cached on disk once.
+# Built on first use rather than at import to keep startup light.
+_SOUND_FILES: Optional[dict[str, Path]] = None
+_SOUND_FILES_LOCK = threading.Lock()
+
+
+def prepare_sounds() -> dict[str, Path]:
+    """Write any missing tone files and return their paths. Empty off Windows."""
+    global _SOUND_FILES
+    with _SOUND_FILES_LOCK:
+        if _SOUND_FILES is not None:
+            return _SOUND_FILES
+        paths: dict[str, Path] = {}
+        if winsound is not None:
+            try:
+                SOUNDS_DIR.mkdir(parents=True, exist_ok=True)
+                for name, (frequency, duration_ms) in _TONES.items():
+                    wav = _make_wav(frequency, duration_ms)
+                    path = SOUNDS_DIR / f"{name}.wav"
+                    if not path.exists() or path.stat().st_size != len(wav):
+                        _write_atomic(path, wav)
+                    paths[name] = path
+            except OSError as e:
+                log.warning("Could not prepare sound files: %s", e)
+        _SOUND_FILES = paths
+        return paths
+
 
-def _beep(frequency: int, duration_ms: int) -> None:
-    """Play a beep tone on Windows. No-op on other platforms."""
+def _play(name: str) -> None:
+    """Start playing a cached tone and return immediately. No-op off Windows."""
+    path: Optional[Path] = prepare_sounds().get(name)
+    if path is None:
+        return
     try:
-        if sys.platform == "win32":
-            import winsound
-            winsound.Beep(frequency, duration_ms)
+        winsound.PlaySound(
+            str(path),
+            winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT,
+        )
     except Exception as e:
-        log.debug("Beep failed: %s", e)
+        log.debug("PlaySound failed: %s", e)
 
 
 def play_start_sound() -> None:
     """Short ascending tone — recording started."""
-    threading.Thread(
-        target=_beep, args=(800, 100), daemon=True,
-    ).start()
+    _play("start")
 
 
 def play_stop_sound() -> None:
     """Short descending tone — recording stopped."""
-    threading.Thread(
-        target=_beep, args=(400, 100), daemon=True,
-    ).start()
+    _play("stop")
 
 
 def play_error_sound() -> None:
     """Low tone — error occurred."""
-    threading.Thread(
-        target=_beep, args=(200, 200), daemon=True,
-    ).start()
+    _play("error")
@@ -5,25 +5,103 @@ Models are loaded from the local models/ directory — no internet required.
 """
 
 import logging
+import os
 import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 
-from sypher_stt.constants import AVAILABLE_MODELS, DEFAULT_MODEL, MODELS_DIR
+from sypher_stt.constants import (
+    AVAILABLE_MODELS,
+    COMPUTE_TYPES,
+    DEFAULT_COMPUTE_TYPE,
+    DEFAULT_MODEL,
+    MODELS_DIR,
+    SAMPLE_RATE,
+)
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
 
 log = logging.getLogger(__name__)
 
+# faster_whisper.WhisperModel, imported on first load (the import is slow)
+_WhisperModel = None
+
+# Shorter clips (< 0.1s) are skipped without loading the model
+_MIN_SAMPLES = SAMPLE_RATE // 10
+
+# Decoding options, built once rather than per utterance. Treat as read-only.
+_VAD_PARAMS = {
+    "min_silence_duration_ms": 300,
+    "speech_pad_ms": 200,
+    "threshold": 0.35,
+}
+_TRANSCRIBE_KWARGS = {
+    "language": "en",
+    "beam_size": 5,
+    "condition_on_previous_text": False,
+    "vad_filter": True,
+    "vad_parameters": _VAD_PARAMS,
+}
+
+
+# (models/ mtime, [(incomplete model dir, mtime)], model names) from the last scan.
+# Incomplete dirs are tracked because model.bin landing in a subdirectory
+# doesn't change the mtime of models/ itself.
+_LOCAL_MODELS_CACHE: Optional[tuple[int, list[tuple[str, Optional[int]]], list[str]]] = None
+
+# The scan works on plain strings; converting the Path is done once here
+_MODELS_DIR_STR = os.fspath(MODELS_DIR)
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
 
 def get_local_models() -> list[str]:
-    """Return model names that exist locally in the models/ directory."""
-    if not MODELS_DIR.exists():
+    """Return model names that exist locally in the models/ directory.
+
+    The scan is cached until models/ (or a partially downloaded model
+    directory in it) changes.
+    """
+    global _LOCAL_MODELS_CACHE
+    dir_mtime = _mtime_ns(_MODELS_DIR_STR)
+    if dir_mtime is None:
         return []
-    return sorted(
-        d.name
-        for d in MODELS_DIR.iterdir()
-        if d.is_dir() and (d / "model.bin").exists()
-    )
+
+    cached = _LOCAL_MODELS_CACHE
+    if cached is not None and cached[0] == dir_mtime and all(
+        _mtime_ns(path) == mtime for path, mtime in cached[1]
+    ):
+        return list(cached[2])
+
+    # scandir's DirEntry caches the type from the directory listing, so each
+    # entry costs one stat (for model.bin) rather than two. is_dir() still
+    # follows symlinks so a models/ entry linked from another drive counts.
+    models: list[str] = []
+    incomplete: list[tuple[str, Optional[int]]] = []
+    with os.scandir(_MODELS_DIR_STR) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            if os.path.isfile(os.path.join(entry.path, "model.bin")):
+                models.append(entry.name)
+            else:
+                incomplete.append((entry.path, _mtime_ns(entry.path)))
+    models.sort()
+    _LOCAL_MODELS_CACHE = (dir_mtime, incomplete, models)
+    return list(models)
+
+
+def invalidate_local_models_cache() -> None:
+    """Force the next get_local_models() call to rescan models/."""
+    global _LOCAL_MODELS_CACHE
+    _LOCAL_MODELS_CACHE = None
 
 
 class Transcriber:
@@ -33,42 +111,72 @@ class Transcriber:
     Models are loaded from the local models/ directory.
     """
 
-    def __init__(self, model_size: str = DEFAULT_MODEL) -> None:
+    def __init__(
+        self,
+        model_size: str = DEFAULT_MODEL,
+        compute_type: str = DEFAULT_COMPUTE_TYPE,
+    ) -> None:
         if model_size not in AVAILABLE_MODELS:
             raise ValueError(
                 f"Unknown model '{model_size}'. Choose from: {AVAILABLE_MODELS}"
             )
+        if compute_type not in COMPUTE_TYPES:
+            raise ValueError(
+                f"Unknown compute type '{compute_type}'. Choose from: {COMPUTE_TYPES}"
+            )
         self._model_size = model_size
+        self._compute_type = compute_type
         self._model = None
         self._load_lock = threading.Lock()
-
-    def _get_model_path(self) -> Path:
-        """Resolve the local path for the configured model."""
-        return MODELS_DIR / self._model_size
-
-    def ensure_model(self) -> None:
-        """Load the model from the local models/ directory. Thread-safe."""
-        if self._model is not None:
-            return
+        # Guards the model settings and _model against a setter racing a load.
+        # Held only briefly, so a settings change never waits on a load.
+        self._settings_lock = threading.Lock()
+
+    def _get_model_path(self, model_size: str) -> Path:
+        """Resolve the local path for a model."""
+        return MODELS_DIR / model_size
+
+    def ensure_model(self) -> "WhisperModel":
+        """Load the model from the local models/ directory and return it. Thread-safe."""
+        model = self._model
+        if model is not None:
+            return model
+        # Import before taking the lock so a concurrent caller isn't held up
+        # by the (slow) faster_whisper import as well as the model load
+        global _WhisperModel
+        if _WhisperModel is None:
+            from faster_whisper import WhisperModel as _WhisperModel
         with self._load_lock:
-            if self._model is not None:
-                return  # Double-check after acquiring lock
-            model_path = self._get_model_path()
-            if not model_path.exists() or not (model_path / "model.bin").exists():
-                raise FileNotFoundError(
-                    f"Model '{self._model_size}' not found at {model_path}. "
-                    f"Available local models: {get_local_models()}"
+            # Retry if the model or compute type changes while loading, so a
+            # stale model is never stored over the new settings
+            while True:
+                model = self._model
+                if model is not None:
+                    return model  # loaded by another caller while we waited
+                with self._settings_lock:
+                    model_size, compute_type = self._model_size, self._compute_type
+                model_path = self._get_model_path(model_size)
+                if not model_path.exists() or not (model_path / "model.bin").exists():
+                    invalidate_local_models_cache()  # make the listing below current
+                    raise FileNotFoundError(
+                        f"Model '{model_size}' not found at {model_path}. "
+                        f"Available local models: {get_local_models()}"
+                    )
+                log.info("Loading model '%s' (%s) from %s", model_size, compute_type, model_path)
+                model = _WhisperModel(
+                    str(model_path),
+                    device="cpu",
+                    compute_type=compute_type,
+                    cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+                    num_workers=1,
+                    local_files_only=True,
                 )
-            log.info("Loading model '%s' from %s", self._model_size, model_path)
-            from faster_whisper import WhisperModel
-
-            self._model = WhisperModel(
-                str(model_path),
-                device="cpu",
-                compute_type="auto",
-                local_files_only=True,
-            )
-            log.info("Model '%s' loaded successfully.", self._model_size)
+                with self._settings_lock:
+                    if (model_size, compute_type) == (self._model_size, self._compute_type):
+                        self._model = model
+                        log.info("Model '%s' loaded successfully.", model_size)
+                        return model
+                    log.info("Model settings changed while loading '%s', reloading.", model_size)
 
     def transcribe(self, audio: np.ndarray) -> str:
         """Transcribe audio to text.
@@ -78,29 +186,33 @@ class Transcriber:
 
         Returns:
             Transcribed text string. Empty string if audio is too short.
+
+        Raises:
+            ValueError: If audio is not mono, i.e. not shaped (N,) or (N, 1).
         """
-        if audio.size < 1600:  # < 0.1s
+        if audio.ndim == 2 and audio.shape[1] == 1:
+            audio = audio[:, 0]
+        elif audio.ndim != 1:
+            raise ValueError(f"Expected mono audio shaped (N,) or (N, 1), got {audio.shape}")
+
+        if audio.size < _MIN_SAMPLES:
             log.debug("Audio too short (%d samples), skipping.", audio.size)
             return ""
 
-        self.ensure_model()
-
-        segments, info = self._model.transcribe(
-            audio,
-            language="en",
-            beam_size=5,
-            condition_on_previous_text=False,
-            vad_filter=True,
-            vad_parameters=dict(
-                min_silence_duration_ms=300,
-                speech_pad_ms=200,
-                threshold=0.35,
-            ),
-        )
+        # CTranslate2 wants contiguous 1-D float32; convert here, visibly,
+        # rather than paying a hidden copy inside faster-whisper.
+        if audio.dtype != np.float32 or not audio.flags.c_contiguous:
+            log.debug("Converting %s audio to contiguous float32.", audio.dtype)
+            audio = np.ascontiguousarray(audio, dtype=np.float32)
+
+        # Use the returned model; a settings change may clear self._model
+        model = self.ensure_model()
+
+        segments, info = model.transcribe(audio, **_TRANSCRIBE_KWARGS)
 
         text_parts = [seg.text.strip() for seg in segments]
         result = " ".join(text_parts).strip()
-        log.info("Transcribed %d chars from %.1fs audio.", len(result), audio.size / 16000)
+        log.info("Transcribed %d chars from %.1fs audio.", len(result), audio.size / SAMPLE_RATE)
         return result
 
     @property
@@ -113,10 +225,27 @@ class Transcriber:
             raise ValueError(
                 f"Unknown model '{value}'. Choose from: {AVAILABLE_MODELS}"
             )
-        if value != self._model_size:
-            log.info("Model changed from '%s' to '%s'. Will reload on next use.", self._model_size, value)
-            self._model_size = value
-            self._model = None
+        with self._settings_lock:
+            if value != self._model_size:
+                log.info("Model changed from '%s' to '%s'. Will reload on next use.", self._model_size, value)
+                self._model_size = value
+                self._model = None
+
+    @property
+    def compute_type(self) -> str:
+        return self._compute_type
+
+    @compute_type.setter
+    def compute_type(self, value: str) -> None:
+        if value not in COMPUTE_TYPES:
+            raise ValueError(
+                f"Unknown compute type '{value}'. Choose from: {COMPUTE_TYPES}"
+            )
+        with self._settings_lock:
+            if value != self._compute_type:
+                log.info("Compute type changed from '%s' to '%s'. Will reload on next use.", self._compute_type, value)
+                self._compute_type = value
+                self._model = None
 
     @property
     def is_loaded(self) -> bool:
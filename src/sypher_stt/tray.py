@@ -6,20 +6,18 @@ Uses pystray + Pillow to draw colored circle icons representing state.
 
 import logging
 import threading
-from enum import Enum
+from functools import lru_cache
 from typing import Callable, Optional
 
 from PIL import Image, ImageDraw
 import pystray
 
-log = logging.getLogger(__name__)
+from sypher_stt.constants import AppState
 
+log = logging.getLogger(__name__)
 
-class AppState(Enum):
-    """Visual states for the tray icon."""
-    IDLE = "idle"
-    RECORDING = "recording"
-    TRANSCRIBING = "transcribing"
+# State changes within this window are coalesced into one icon update
+_STATE_DEBOUNCE_SECONDS = 0.030
 
 
 STATE_COLORS: dict[AppState, str] = {
@@ -35,8 +33,12 @@ STATE_TOOLTIPS: dict[AppState, str] = {
 }
 
 
+@lru_cache(maxsize=16)
 def _create_icon_image(color: str, size: int = 64) -> Image.Image:
-    """Create a simple circle icon with the given color."""
+    """Create a simple circle icon with the given color.
+
+    Cached: callers share the returned image and must not modify it.
+    """
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     margin = 4
@@ -61,8 +63,24 @@ class TrayApp:
         self._on_settings = on_settings
         self._hotkey_name = hotkey_name
         self._version = version
-        self._state = AppState.IDLE
+        self._state = AppState.IDLE          # latest requested state
+        self._shown_state = AppState.IDLE    # state the icon currently displays
+        self._state_lock = threading.Lock()
+        self._state_timer: Optional[threading.Timer] = None
         self._icon: Optional[pystray.Icon] = None
+        self._ready = threading.Event()
+        # Built once so state changes are just attribute assignments
+        self._state_icons: dict[AppState, Image.Image] = {
+            s: _create_icon_image(STATE_COLORS[s]) for s in AppState
+        }
+        self._state_tooltips: dict[AppState, str] = {}
+        self._build_tooltips()
+
+    def _build_tooltips(self) -> None:
+        hotkey = self._hotkey_name.upper()
+        self._state_tooltips = {
+            s: STATE_TOOLTIPS[s].format(hotkey=hotkey) for s in AppState
+        }
 
     def _build_menu(self) -> pystray.Menu:
         return pystray.Menu(
@@ -71,8 +89,10 @@ class TrayApp:
                 None,
                 enabled=False,
             ),
+            # Text is evaluated when the menu is shown, so a hotkey change
+            # only needs update_menu() rather than a new Menu
             pystray.MenuItem(
-                f"Hotkey: {self._hotkey_name.upper()}",
+                lambda item: f"Hotkey: {self._hotkey_name.upper()}",
                 None,
                 enabled=False,
             ),
@@ -88,32 +108,65 @@ class TrayApp:
         self._on_quit()
 
     def set_state(self, state: AppState) -> None:
-        self._state = state
-        if self._icon is not None:
-            self._icon.icon = _create_icon_image(STATE_COLORS[state])
-            tooltip = STATE_TOOLTIPS[state].format(hotkey=self._hotkey_name.upper())
-            self._icon.title = tooltip
+        """Request a new icon state.
+
+        Each icon/title write is a shell round-trip, so updates are applied
+        after a short delay and only the latest state in that window is shown.
+        """
+        with self._state_lock:
+            self._state = state
+            if self._icon is None or self._state_timer is not None:
+                return
+            self._state_timer = threading.Timer(_STATE_DEBOUNCE_SECONDS, self._flush_state)
+            self._state_timer.daemon = True
+            self._state_timer.start()
+
+    def _flush_state(self) -> None:
+        with self._state_lock:
+            self._state_timer = None
+            state = self._state
+            if state is self._shown_state or self._icon is None:
+                return
+            self._shown_state = state
+            self._icon.icon = self._state_icons[state]
+            self._icon.title = self._state_tooltips[state]
 
     def run(self) -> None:
         """Start the tray icon. Blocks the calling thread."""
-        tooltip = STATE_TOOLTIPS[AppState.IDLE].format(
-            hotkey=self._hotkey_name.upper()
-        )
-        self._icon = pystray.Icon(
-            name="sypher_stt",
-            icon=_create_icon_image(STATE_COLORS[AppState.IDLE]),
-            title=tooltip,
-            menu=self._build_menu(),
-        )
+        with self._state_lock:
+            self._shown_state = self._state
+            self._icon = pystray.Icon(
+                name="sypher_stt",
+                icon=self._state_icons[self._shown_state],
+                title=self._state_tooltips[self._shown_state],
+                menu=self._build_menu(),
+            )
         log.info("System tray icon started.")
-        self._icon.run()
+        self._icon.run(setup=self._on_setup)
+
+    def _on_setup(self, icon: pystray.Icon) -> None:
+        # Supplying setup= disables pystray's automatic show
+        icon.visible = True
+        self._ready.set()
 
     def run_detached(self) -> threading.Thread:
         t = threading.Thread(target=self.run, daemon=True, name="tray-icon")
         t.start()
         return t
 
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the tray icon is visible.
+
+        Returns:
+            True if the icon is ready, False if the timeout expired.
+        """
+        return self._ready.wait(timeout)
+
     def stop(self) -> None:
+        with self._state_lock:
+            if self._state_timer is not None:
+                self._state_timer.cancel()
+                self._state_timer = None
         if self._icon is not None:
             self._icon.stop()
 
@@ -127,6 +180,8 @@ class TrayApp:
 
     def update_hotkey_display(self, hotkey_name: str) -> None:
         self._hotkey_name = hotkey_name
+        self._build_tooltips()
         if self._icon is not None:
-            self._icon.menu = self._build_menu()
-            self.set_state(self._state)
+            self._icon.update_menu()
+            with self._state_lock:
+                self._icon.title = self._state_tooltips[self._shown_state]